@@ -16,19 +16,35 @@ Optional dependencies (install only what you need):
   pip install boto3                    # Amazon S3
   pip install google-cloud-storage     # Google Cloud Storage
   pip install azure-storage-blob       # Azure Blob Storage
+  pip install numba                    # JIT-compiled Luhn validation
+  pip install hyperscan                # Faster candidate scanning (or google-re2)
+  pip install pyarrow                  # Faster CSV scanning
+  cythonize -i _scanner.pyx            # Native candidate scanner + Luhn (needs Cython)
 """
 
 import re
 import csv
+import io
 import os
+import sys
+import queue
+import mmap
+import codecs
+import unicodedata
 import sqlite3
 import tempfile
+import threading
 import base64
 import urllib.parse
 import html as html_mod
 from pathlib import Path
 from typing import List, Dict, Tuple
 import argparse
+from bisect import bisect_right
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from itertools import accumulate
 
 # ── Optional dependency detection ────────────────────────────────────────────
 
@@ -74,10 +90,602 @@ try:
 except ImportError:
     HAS_AZURE = False
 
+try:
+    from _scanner import luhn_valid as _native_luhn_valid, scan_buffer
+    HAS_NATIVE_SCANNER = True
+except ImportError:
+    HAS_NATIVE_SCANNER = False
+
+# The native Luhn check replaces both Numba kernels, so with the extension
+# built Numba isn't imported (or compiled) at all
+HAS_NUMBA = False
+if not HAS_NATIVE_SCANNER:
+    try:
+        import numpy as np
+        from numba import njit, types as nb_types
+        HAS_NUMBA = True
+    except ImportError:
+        pass
+
+try:
+    import hyperscan
+    HAS_HYPERSCAN = True
+except ImportError:
+    HAS_HYPERSCAN = False
+
+try:
+    import re2
+    HAS_RE2 = True
+except ImportError:
+    HAS_RE2 = False
+
+try:
+    import pyarrow as pa
+    import pyarrow.compute as pa_compute
+    import pyarrow.csv as pa_csv
+    HAS_ARROW = True
+except ImportError:
+    HAS_ARROW = False
+
 # ── Scannable extensions (used by directory and cloud scanners) ───────────────
 
 SCANNABLE_EXTENSIONS = {'.csv', '.txt', '.log', '.json', '.xml', '.sql', '.pdf', '.xlsx'}
 
+# ── Precompiled patterns ──────────────────────────────────────────────────────
+
+# Separators allowed between digit groups (stripped before validation)
+_STRIP_RE = re.compile(r'[\s-]')
+
+
+def _candidate_pattern(sep: str) -> str:
+    """16-19 digits, optionally grouped in fours by one *sep* character."""
+    return r'\b\d{4}' + sep + r'?\d{4}' + sep + r'?\d{4}' + sep + r'?\d{4,7}\b'
+
+
+# Candidate card numbers grouped by a space or dash
+_CANDIDATE_RE = re.compile(_candidate_pattern(r'[\s-]'))
+
+# As above, but a separator never crosses a line break, so a block of many
+# lines can be scanned in one call with the same results as line by line
+_LINE_CANDIDATE_RE = re.compile(_candidate_pattern(r'(?:[^\S\r\n]|-)'))
+
+# Decode mode: base64 tokens long enough to hold a 13-digit number once
+# encoded, and even-length hex runs of 26+ characters (13 bytes)
+_BASE64_TOKEN_RE = re.compile(r'[A-Za-z0-9+/]{20,}={0,2}')
+_HEX_TOKEN_RE = re.compile(r'\b[0-9a-fA-F]{26,}\b')
+
+# Every candidate holds at least 16 digits. Counting the ASCII ones with one
+# C-level translate() lets the regex fallbacks skip text that has too few
+# without walking it, unless it holds other decimal digits (fullwidth,
+# Arabic-Indic, ...), which \d matches as well
+_MIN_CANDIDATE_DIGITS = 16
+_NON_DIGIT_BYTES = bytes(c for c in range(256) if not 0x30 <= c <= 0x39)
+_NON_ASCII_DIGIT_RE = re.compile(r'[^\D0-9]')
+
+
+class _DecimalToAscii(dict):
+    """
+    str.translate() table mapping every Unicode decimal digit (what \d
+    matches) to its ASCII digit, so "４１１１..." is Luhn-checked as "4111...".
+    Other characters map to themselves. Entries are filled in on first use.
+    """
+
+    def __missing__(self, code: int) -> int:
+        digit = unicodedata.decimal(chr(code), None)
+        self[code] = code if digit is None else 0x30 + digit
+        return self[code]
+
+
+_DECIMAL_TO_ASCII = _DecimalToAscii()
+
+# Server-side prefilter for database scans (POSIX syntax for ~ and REGEXP).
+# Every plain-mode candidate holds three runs of four ASCII digits, each at
+# most one separator apart; {0,3} leaves room for a multi-byte separator on
+# byte-oriented engines such as MySQL 5.7
+_SQL_DIGIT_RUNS = "'[0-9]{4}[^0-9]{0,3}[0-9]{4}[^0-9]{0,3}[0-9]{4}'"
+
+# Non-ASCII decimal digits ("４１１１...") don't match [0-9], so any cell with
+# a multi-byte character passes as well. Both engines have these functions
+_SQL_NON_ASCII = "octet_length({col}) <> char_length({col})"
+
+# The same three digit runs for Arrow's RE2 column matcher, which counts
+# characters rather than bytes. \p{Nd} is any decimal digit, like \d in the
+# candidate patterns. {0,2} covers a quoted \r\n, which the text mode
+# csv.reader path sees as a single \n
+_ARROW_DIGIT_RUNS = r'\p{Nd}{4}\P{Nd}{0,2}\p{Nd}{4}\P{Nd}{0,2}\p{Nd}{4}'
+_LONE_CR_RE = re.compile(rb'\r(?!\n)')
+
+# SQLite has no REGEXP by default: text is checked with a GLOB for two
+# four-digit runs (a looser superset, evaluated natively). Text whose byte
+# length differs from its character count holds a NUL, where GLOB and
+# length() stop early, or a multi-byte character such as a non-ASCII digit,
+# and always passes. INTEGER and REAL cells pass only when str() could
+# render them with 16+ digits; blobs always pass
+_SQLITE_DIGIT_RUNS = (
+    "CASE typeof({col})"
+    " WHEN 'text' THEN {col} GLOB '*[0-9][0-9][0-9][0-9]*[0-9][0-9][0-9][0-9]*'"
+    " OR length(CAST({col} AS BLOB)) <> length({col})"
+    " WHEN 'integer' THEN abs({col}) >= 1e15"
+    " WHEN 'real' THEN abs({col}) >= 1e15 OR {col} != round({col}, 6)"
+    " WHEN 'blob' THEN 1 ELSE 0 END"
+)
+
+
+def _number_may_hold_card(number) -> bool:
+    """
+    Python twin of the INTEGER/REAL cases above: False when str(number) can't
+    hold a 16+ digit run, so neither plain nor decode mode could find a card.
+    """
+    if abs(number) >= 1e15:
+        return True
+    return isinstance(number, float) and number != round(number, 6)
+
+# ── Candidate scanning ────────────────────────────────────────────────────────
+
+def _collect_span(match_id, start, end, flags, spans):
+    """Hyperscan match callback: records the (start, end) offsets."""
+    spans.append((start, end))
+
+
+class _CandidateScanner:
+    """
+    Finds candidate card numbers with the fastest engine installed.
+
+    ASCII text is handed to the native _scanner extension when it is built,
+    else to Hyperscan or RE2 — all scan in a single linear pass — else to a
+    bytes pattern, which re runs well over twice as fast as the Unicode-aware
+    str one. Only non-ASCII text needs the str pattern. The ASCII engines get
+    the separator class spelled out (their \\s lacks \\x1c-\\x1f); on ASCII
+    text that matches exactly what the str pattern does.
+    """
+
+    def __init__(self, regex, ascii_sep: str, cross_lines: bool):
+        self.regex = regex
+        self.cross_lines = cross_lines
+        self.hyperscan = None
+        self.re2 = None
+        ascii_pattern = _candidate_pattern(ascii_sep)
+        # Bytes twin of regex for ASCII data when no faster engine is present
+        self.ascii_regex = re.compile(ascii_pattern.encode('ascii'))
+        if HAS_NATIVE_SCANNER:
+            return  # the extension takes no compiled pattern
+
+        if HAS_HYPERSCAN:
+            # Scratch space serves one scan at a time; each thread that
+            # scans (e.g. a pooled database table) allocates its own
+            self.hyperscan_local = threading.local()
+            self.hyperscan = hyperscan.Database()
+            self.hyperscan.compile(
+                expressions=[ascii_pattern.encode('ascii')], ids=[0],
+                elements=1, flags=[hyperscan.HS_FLAG_SOM_LEFTMOST],
+            )
+        elif HAS_RE2:
+            self.re2 = re2.compile(ascii_pattern)
+
+    def spans(self, text: str) -> List[Tuple[int, int]]:
+        """
+        Returns (start, end) offsets of every match in *text*, as re.finditer
+        would.
+        """
+        if text.isascii():
+            return self.ascii_spans(text.encode('ascii'))
+        # ASCII digits encode to themselves; every other character to bytes
+        # outside the digit range
+        ascii_digits = text.encode('utf-8', 'surrogatepass').translate(None, _NON_DIGIT_BYTES)
+        if (len(ascii_digits) < _MIN_CANDIDATE_DIGITS
+                and not _NON_ASCII_DIGIT_RE.search(text)):
+            return []
+        return [m.span() for m in self.regex.finditer(text)]
+
+    def ascii_spans(self, data: bytes) -> List[Tuple[int, int]]:
+        """
+        Same as spans() for ASCII text that is still in bytes form.
+
+        Hyperscan also reports matches overlapping an earlier one; keeping
+        the leftmost non-overlapping spans gives the finditer result, since a
+        given start has only one possible end.
+        """
+        if HAS_NATIVE_SCANNER:
+            return scan_buffer(data, self.cross_lines)
+
+        if self.hyperscan is not None:
+            scratch = getattr(self.hyperscan_local, 'scratch', None)
+            if scratch is None:
+                scratch = self.hyperscan_local.scratch = hyperscan.Scratch(self.hyperscan)
+            spans: List[Tuple[int, int]] = []
+            self.hyperscan.scan(data, match_event_handler=_collect_span,
+                                context=spans, scratch=scratch)
+            spans.sort()
+            result = []
+            last_end = 0
+            for start, end in spans:
+                if start >= last_end:
+                    result.append((start, end))
+                    last_end = end
+            return result
+
+        if len(data.translate(None, _NON_DIGIT_BYTES)) < _MIN_CANDIDATE_DIGITS:
+            return []
+        engine = self.re2 if self.re2 is not None else self.ascii_regex
+        return [m.span() for m in engine.finditer(data)]
+
+
+_CANDIDATES = _CandidateScanner(_CANDIDATE_RE, r'[\t\n\x0b\x0c\r\x1c-\x1f -]',
+                                cross_lines=True)
+_LINE_CANDIDATES = _CandidateScanner(_LINE_CANDIDATE_RE, r'[\t\x0b\x0c\x1c-\x1f -]',
+                                     cross_lines=False)
+
+# Batched scans: characters (or bytes) read per chunk of a text file, cells
+# per regex call
+_CHUNK_CHARS = 4 << 20
+_BATCH_CELLS = 4096
+
+# Buffer for files read in text mode: one system call per MiB instead of per
+# 8 KiB, which matters most on network filesystems
+_READ_BUFFER_BYTES = 1 << 20
+
+# Same for the CSV report, written in one pass
+_WRITE_BUFFER_BYTES = 1 << 20
+
+# Characters of a line examined for its 100-character report context
+_CONTEXT_HEAD_CHARS = 256
+
+# Default cap on concurrent connections for PostgreSQL and MySQL scans.
+# Each table is scanned on one of the scan's connections, so a database opens
+# at most min(tables, pool size) of them, fewer if the server refuses more
+_DB_POOL_SIZE = 25
+
+# Session settings for PostgreSQL scan connections (9.6+), sent as libpq
+# startup options so they cost no round trip and survive rollbacks. Older
+# servers and poolers such as PgBouncer refuse the connection instead, and
+# scans then reconnect without them. With
+# parallel setup and tuple costs at zero, the planner uses parallel workers
+# for any table big enough to qualify (min_parallel_table_scan_size), so
+# large tables are read, and prefiltered, by several backends at once
+_PG_SESSION_OPTIONS = ('-c max_parallel_workers_per_gather=4 '
+                       '-c parallel_setup_cost=0 -c parallel_tuple_cost=0')
+
+# Directory scans with fewer files than this stay in-process; starting a
+# worker pool costs more than it saves
+_PARALLEL_MIN_FILES = 4
+
+# Cloud objects in these formats are scanned straight off the network stream;
+# PDF and Excel need random access and are still downloaded to a temp file
+_STREAMABLE_EXTENSIONS = SCANNABLE_EXTENSIONS - {'.pdf', '.xlsx'}
+_STREAM_CHUNK_BYTES = 1 << 20
+
+# Cloud scanners fetch this many objects concurrently while the main thread
+# scans; text objects up to _PREFETCH_MAX_BYTES are read whole in the
+# background, larger ones are streamed when their turn comes. _prefetch holds
+# up to 2 * _CLOUD_WORKERS objects, so whole reads stay within a 64 MiB budget
+_CLOUD_WORKERS = 16
+_PREFETCH_MAX_BYTES = (64 << 20) // (2 * _CLOUD_WORKERS)
+
+
+# ── Streaming helpers ─────────────────────────────────────────────────────────
+
+def _decode_stream(byte_chunks):
+    """
+    Decodes UTF-8 byte chunks into text chunks the way open(..., 'r',
+    encoding='utf-8', errors='ignore') would, universal newlines included.
+    Characters split across chunk boundaries are reassembled.
+    """
+    decoder = io.IncrementalNewlineDecoder(
+        codecs.getincrementaldecoder('utf-8')(errors='ignore'), translate=True)
+    for chunk in byte_chunks:
+        text = decoder.decode(chunk)
+        if text:
+            yield text
+    text = decoder.decode(b'', final=True)
+    if text:
+        yield text
+
+
+def _prefetch(fetch, items, workers: int = _CLOUD_WORKERS):
+    """
+    Yields (item, future) pairs in input order while fetch(item) runs ahead
+    on a thread pool. At most 2 * workers fetches are queued or held at once,
+    so memory stays bounded however many items there are.
+    """
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        ahead = deque()
+        for item in items:
+            ahead.append((item, pool.submit(fetch, item)))
+            if len(ahead) >= 2 * workers:
+                yield ahead.popleft()
+        while ahead:
+            yield ahead.popleft()
+
+
+def _iter_lines(text_chunks):
+    """Re-splits text chunks into lines, as iterating a text file would."""
+    pending: List[str] = []
+    for chunk in text_chunks:
+        lines = chunk.split('\n')
+        if len(lines) == 1:
+            pending.append(chunk)
+            continue
+        pending.append(lines[0])
+        yield ''.join(pending) + '\n'
+        for line in lines[1:-1]:
+            yield line + '\n'
+        pending = [lines[-1]]
+    tail = ''.join(pending)
+    if tail:
+        yield tail
+
+
+class _CopyRowSink:
+    """
+    File-like target for psycopg2's copy_expert(). CSV output of COPY ...
+    TO STDOUT is buffered up to _STREAM_CHUNK_BYTES and handed to consume()
+    as parsed rows, whole records at a time, so a table streams in a single
+    round trip with bounded memory.
+
+    A record ends at a newline preceded by an even number of quote
+    characters: values with quotes, commas or line breaks are quoted, and
+    a quote inside one is doubled. The first `scanned` pending bytes (holding
+    `quotes` quotes) are known to contain no record end, so each write only
+    examines what arrived since, however long a record grows.
+    """
+
+    def __init__(self, consume):
+        self.consume = consume
+        self.pending = bytearray()
+        self.scanned = 0
+        self.quotes = 0
+        self.started = False
+
+    def write(self, data) -> None:
+        self.started = True
+        self.pending += data
+        if len(self.pending) < _STREAM_CHUNK_BYTES:
+            return
+        end = len(self.pending)
+        quotes = self.quotes + self.pending.count(b'"', self.scanned)
+        # Walk back over the new newlines, counting the quotes after each
+        tail_quotes = 0
+        cut = self.pending.rfind(b'\n', self.scanned)
+        upper = end
+        while cut >= 0:
+            tail_quotes += self.pending.count(b'"', cut, upper)
+            if (quotes - tail_quotes) % 2 == 0:
+                break
+            upper = cut
+            cut = self.pending.rfind(b'\n', self.scanned, cut)
+        if cut >= 0:
+            self._emit(self.pending[:cut + 1])
+            del self.pending[:cut + 1]
+            self.scanned, self.quotes = end - cut - 1, tail_quotes
+        else:
+            self.scanned, self.quotes = end, quotes
+
+    def close(self) -> None:
+        """Hands on whatever is left once the COPY has finished."""
+        if self.pending:
+            self._emit(self.pending)
+            self.pending = bytearray()
+            self.scanned = self.quotes = 0
+
+    def _emit(self, records) -> None:
+        text = records.decode('utf-8')
+        self.consume(csv.reader(io.StringIO(text, newline='')))
+
+
+def _line_context(block, line_start: int, line_end: int) -> str:
+    """
+    Returns block[line_start:line_end].strip()[:100], decoded if *block* is
+    ASCII bytes, without copying or decoding the rest of a very long line.
+    """
+    head_end = line_start + _CONTEXT_HEAD_CHARS
+    if head_end < line_end:
+        head = block[line_start:head_end]
+        if isinstance(head, bytes):
+            head = head.decode('ascii')
+        head = head.lstrip()
+        # 100 characters up to a non-space one: the line's own strip() can't
+        # cut into them
+        if len(head.rstrip()) >= 100:
+            return head[:100]
+    line = block[line_start:line_end]
+    if isinstance(line, bytes):
+        line = line.decode('ascii')
+    return line.strip()[:100]
+
+
+# ── Directory walking ─────────────────────────────────────────────────────────
+
+# Leading bytes checked for a NUL before a file of an extension outside
+# SCANNABLE_EXTENSIONS is scanned as text (git's binary heuristic)
+_BINARY_SNIFF_BYTES = 8000
+
+
+def _iter_files(directory: str, extensions: frozenset):
+    """
+    Yields the paths of files under directory whose lowercased extension is
+    in extensions, in Path.rglob('*') order: a directory's own entries, then
+    each subdirectory depth-first. Symlinked directories are not followed
+    and unreadable ones are skipped, also as rglob does.
+
+    os.scandir entries carry their file type from the directory listing, so
+    on most filesystems this needs no stat() call per entry.
+    """
+    try:
+        with os.scandir(directory) as it:
+            entries = list(it)
+    except OSError:
+        return
+    subdirs = []
+    for entry in entries:
+        name = entry.name
+        # Children of '.' are reported without the './' prefix, like Path
+        path = name if directory == '.' else entry.path
+        # Path.suffix: no extension for a leading or trailing dot
+        dot = name.rfind('.')
+        ext = name[dot:].lower() if 0 < dot < len(name) - 1 else ''
+        try:
+            if entry.is_dir(follow_symlinks=False):
+                subdirs.append(path)
+            elif ext in extensions and entry.is_file():
+                yield path
+        except OSError:
+            continue
+    for subdir in subdirs:
+        yield from _iter_files(subdir, extensions)
+
+
+def _looks_binary(path: str) -> bool:
+    """True if the first _BINARY_SNIFF_BYTES of the file hold a NUL byte."""
+    try:
+        with open(path, 'rb') as f:
+            return b'\0' in f.read(_BINARY_SNIFF_BYTES)
+    except OSError:
+        return False  # let the scanner report it
+
+
+# ── Luhn kernel ───────────────────────────────────────────────────────────────
+
+def _luhn_sum(buf, n: int) -> int:
+    """
+    Returns the Luhn (mod-10) sum of the first *n* ASCII digits in *buf*.
+
+    *buf* is a bytes-like object of validated ASCII digits. The loop is kept
+    to plain integer arithmetic so Numba can compile it to native code; without
+    Numba it runs as ordinary Python.
+    """
+    s = 0
+    for i in range(n):
+        d = buf[n - 1 - i] - 48
+        if i & 1:
+            d <<= 1
+            if d > 9:
+                d -= 9
+        s += d
+    return s
+
+
+if HAS_NUMBA:
+    # An explicit signature compiles (or loads from the on-disk cache) right
+    # here, at import, so the first real scan doesn't pay for it. The only
+    # caller passes bytes, so one specialisation covers every call.
+    _luhn_sum = njit(
+        nb_types.int64(nb_types.Bytes(nb_types.uint8, 1, 'C', readonly=True),
+                       nb_types.intp),
+        cache=True, boundscheck=False,
+    )(_luhn_sum)
+
+
+def _luhn_batch(flat, ends):
+    """
+    Luhn-checks many stripped numbers at once. *flat* holds their bytes back
+    to back and *ends* the offset just past each one; returns a bool array
+    that is True where a number is 13-19 ASCII digits and passes Luhn.
+    """
+    valid = np.empty(len(ends), np.bool_)
+    start = 0
+    for k in range(len(ends)):
+        end = ends[k]
+        n = end - start
+        ok = 13 <= n <= 19
+        s = 0
+        for i in range(n):
+            d = flat[end - 1 - i] - 48
+            if d < 0 or d > 9:
+                ok = False
+            if i & 1:
+                d <<= 1
+                if d > 9:
+                    d -= 9
+            s += d
+        valid[k] = ok and s % 10 == 0
+        start = end
+    return valid
+
+
+if HAS_NUMBA:
+    _luhn_batch = njit(
+        nb_types.boolean[:](nb_types.Bytes(nb_types.uint8, 1, 'C', readonly=True),
+                            nb_types.int64[:]),
+        cache=True, boundscheck=False,
+    )(_luhn_batch)
+
+# Text with at least this many candidates is Luhn-checked in one _luhn_batch
+# call instead of one Numba call per number
+_LUHN_BATCH_MIN = 32
+
+# ASCII members of the [\s-] separator class, for bytes.translate(None, ...)
+_SEPARATOR_BYTES = b'\t\n\x0b\x0c\r\x1c\x1d\x1e\x1f -'
+
+# Luhn contribution of each ASCII digit in a doubled position: 2d, minus 9
+# when that exceeds 9
+_LUHN_DOUBLED = bytes((2 * (b - 48) - 9 * (b >= 53)) if 48 <= b <= 57 else 0
+                      for b in range(256))
+
+
+def _luhn_table_sum(digits: bytes) -> int:
+    """
+    Returns the Luhn sum of a bytes string of ASCII digits.
+
+    Both halves of the sum are C-level operations: the undoubled digits are
+    summed straight from their bytes, the doubled ones after one translate()
+    through _LUHN_DOUBLED. Faster than any per-digit Python loop.
+    """
+    return (sum(digits[-1::-2]) - 48 * ((len(digits) + 1) >> 1)
+            + sum(digits[-2::-2].translate(_LUHN_DOUBLED)))
+
+
+def _luhn_valid(digits: bytes) -> bool:
+    """
+    Luhn check on an already-stripped bytes string: 13-19 ASCII digits whose
+    Luhn sum is a multiple of 10. Shared by luhn_check and the match loop.
+    """
+    length = len(digits)
+    if length < 13 or length > 19 or not digits.isdigit():
+        return False
+
+    if HAS_NUMBA:
+        checksum = _luhn_sum(digits, length)
+    else:
+        checksum = _luhn_table_sum(digits)
+    return checksum % 10 == 0
+
+
+if HAS_NATIVE_SCANNER:
+    # Same check in C: SWAR for 16 digits, about ten times faster per call
+    _luhn_valid = _native_luhn_valid
+
+
+# ── BIN-prefix brand lookup ───────────────────────────────────────────────────
+
+# CreditCardDetector.CARD_PATTERNS as (brand, IIN prefixes, lengths) rules.
+# No brand's pattern looks past the first four digits, so every rule can be
+# expanded into a dict keyed by (first four digits, length).
+_BIN_RULES = [
+    ('Visa', ['4'], (13, 16)),
+    ('Mastercard', [str(p) for p in range(51, 56)] + [str(p) for p in range(22, 28)], (16,)),
+    ('Amex', ['34', '37'], (15,)),
+    ('Discover', ['6011', '65'], (16,)),
+    ('Diners', [str(p) for p in range(300, 306)] + ['36', '38'], (14,)),
+    ('JCB', ['2131', '1800'], (15,)),
+    ('JCB', ['35'], (16,)),
+]
+
+
+def _expand_bin_rules(rules) -> Dict[Tuple[str, int], str]:
+    """Maps (four-digit prefix, length) to the brand of each rule."""
+    table: Dict[Tuple[str, int], str] = {}
+    for brand, prefixes, lengths in rules:
+        for prefix in prefixes:
+            width = 4 - len(prefix)
+            for tail in range(10 ** width):
+                bin4 = prefix + str(tail).zfill(width) if width else prefix
+                for length in lengths:
+                    table[(bin4, length)] = brand
+    return table
+
+
+_BRAND_BY_BIN = _expand_bin_rules(_BIN_RULES)
+
 
 class CreditCardDetector:
     """
@@ -99,9 +707,17 @@ class CreditCardDetector:
         'JCB': r'^(?:2131|1800|35\d{3})\d{11}$',                       # 16 digits
     }
 
-    def __init__(self, decode_mode: bool = False):
+    # All brands as one named-group alternation, tried in CARD_PATTERNS order,
+    # so a single match call classifies a number. Plain digit strings take
+    # the _BRAND_BY_BIN dict lookup instead; this covers everything else.
+    _BRAND_UNION = re.compile('|'.join(
+        f'(?P<{brand}>{pattern})' for brand, pattern in CARD_PATTERNS.items()
+    ))
+
+    def __init__(self, decode_mode: bool = False, db_prefilter: bool = True):
         self.findings = []
         self.decode_mode = decode_mode
+        self.db_prefilter = db_prefilter
 
     # ── Encoding-aware detection ──────────────────────────────────────────────
 
@@ -156,7 +772,7 @@ class CreditCardDetector:
 
         # ── Base64 substrings ─────────────────────────────────────────────────
         # Require ≥ 20 chars so a 13-digit card (min) has room once encoded.
-        for m in re.finditer(r'[A-Za-z0-9+/]{20,}={0,2}', text):
+        for m in _BASE64_TOKEN_RE.finditer(text):
             token = m.group()
             # Normalise padding
             pad = (4 - len(token) % 4) % 4
@@ -173,7 +789,7 @@ class CreditCardDetector:
 
         # ── Hex substrings ────────────────────────────────────────────────────
         # 13-digit min card → 13 bytes → 26 hex chars minimum.
-        for m in re.finditer(r'\b[0-9a-fA-F]{26,}\b', text):
+        for m in _HEX_TOKEN_RE.finditer(text):
             token = m.group()
             if len(token) % 2 != 0:
                 continue
@@ -205,31 +821,25 @@ class CreditCardDetector:
         5. If sum % 10 == 0, the number is valid
 
         Args:
-            card_number: String of digits (no spaces/dashes)
+            card_number: Card number; whitespace and dashes between digits
+                         are stripped first. (The scanners strip candidates
+                         themselves and call the strict _luhn_valid directly.)
 
         Returns:
             bool: True if valid per Luhn algorithm
         """
-        card_number = re.sub(r'[\s-]', '', card_number)
-
-        if not card_number.isdigit():
-            return False
-
-        if len(card_number) < 13 or len(card_number) > 19:
-            return False
-
-        digits = [int(d) for d in card_number]
-        checksum = 0
-
-        for i in range(len(digits) - 1, -1, -1):
-            digit = digits[i]
-            if (len(digits) - i) % 2 == 0:
-                digit *= 2
-                if digit > 9:
-                    digit -= 9
-            checksum += digit
+        if card_number.isascii():
+            # Strip separators and check digits in C, without a regex
+            digits = card_number.encode('ascii').translate(None, _SEPARATOR_BYTES)
+        else:
+            # Unicode separators (no-break space, ideographic space, ...)
+            # and decimal digits (fullwidth, Arabic-Indic, ...)
+            card_number = _STRIP_RE.sub('', card_number).translate(_DECIMAL_TO_ASCII)
+            if not card_number.isascii():
+                return False
+            digits = card_number.encode('ascii')
 
-        return checksum % 10 == 0
+        return _luhn_valid(digits)
 
     def identify_card_brand(self, card_number: str) -> str:
         """
@@ -241,38 +851,97 @@ class CreditCardDetector:
         Returns:
             str: Card brand name or 'Unknown'
         """
-        for brand, pattern in self.CARD_PATTERNS.items():
-            if re.match(pattern, card_number):
-                return brand
-        return 'Unknown'
+        if card_number.isascii() and card_number.isdigit():
+            return _BRAND_BY_BIN.get((card_number[:4], len(card_number)), 'Unknown')
+        match = self._BRAND_UNION.match(card_number)
+        return match.lastgroup if match else 'Unknown'
 
-    def _match_card_numbers(self, text: str,
-                            encoding: str = 'plain') -> List[Dict]:
+    def _match_spans(self, text, scanner: _CandidateScanner = _CANDIDATES
+                     ) -> List[Tuple[int, str, str]]:
         """
-        Core regex + Luhn scan on a single string.
-        All findings are tagged with *encoding* so callers know the source.
+        Core regex + Luhn scan on a single string. Returns lightweight
+        (position, original_format, clean_number) tuples for valid numbers;
+        finding dicts are only built by _finding once a match is kept.
+        *text* may also be ASCII bytes, which are scanned without decoding.
         """
-        findings = []
-        pattern = r'\b\d{4}[\s-]?\d{4}[\s-]?\d{4}[\s-]?\d{4,7}\b'
-
-        for match in re.finditer(pattern, text):
-            candidate = match.group()
-            clean_number = re.sub(r'[\s-]', '', candidate)
-
-            if self.luhn_check(clean_number):
-                brand = self.identify_card_brand(clean_number)
-                masked = f"{clean_number[:6]}...{clean_number[-4:]}"
-
-                findings.append({
-                    'original_format': candidate,
-                    'masked_number': masked,
-                    'card_brand': brand,
-                    'position': match.start(),
-                    'length': len(clean_number),
-                    'detected_encoding': encoding,
-                })
-
-        return findings
+        is_bytes = isinstance(text, bytes)
+        spans = scanner.ascii_spans(text) if is_bytes else scanner.spans(text)
+        if HAS_NUMBA and len(spans) >= _LUHN_BATCH_MIN:
+            return self._match_spans_batched(text, spans, is_bytes)
+        matches = []
+        for start, end in spans:
+            candidate = text[start:end]
+            # Strip and validate each candidate once, as bytes. Only numbers
+            # that pass Luhn are decoded, and only kept findings get a brand.
+            if is_bytes:
+                digits = candidate.translate(None, _SEPARATOR_BYTES)
+            else:
+                clean_number = _STRIP_RE.sub('', candidate)
+                if clean_number.isascii():
+                    digits = clean_number.encode('ascii')
+                else:
+                    # Other decimal digits are checked as their ASCII twins;
+                    # the finding keeps them as written
+                    digits = clean_number.translate(_DECIMAL_TO_ASCII).encode('ascii', 'ignore')
+            if not _luhn_valid(digits):
+                continue
+            if is_bytes:
+                candidate = candidate.decode('ascii')
+                clean_number = digits.decode('ascii')
+            matches.append((start, candidate, clean_number))
+        return matches
+
+    def _match_spans_batched(self, text, spans: List[Tuple[int, int]],
+                             is_bytes: bool) -> List[Tuple[int, str, str]]:
+        """
+        _match_spans for many candidates at once: all are stripped first, then
+        Luhn-checked together in a single Numba call over their digits.
+        """
+        candidates = [text[start:end] for start, end in spans]
+        if is_bytes:
+            digits = [c.translate(None, _SEPARATOR_BYTES) for c in candidates]
+        else:
+            digits = []
+            for candidate in candidates:
+                clean_number = _STRIP_RE.sub('', candidate)
+                if not clean_number.isascii():
+                    clean_number = clean_number.translate(_DECIMAL_TO_ASCII)
+                digits.append(clean_number.encode('ascii', 'ignore'))
+        ends = np.fromiter(accumulate(map(len, digits)), np.int64, len(digits))
+        matches = []
+        for k in np.flatnonzero(_luhn_batch(b''.join(digits), ends)).tolist():
+            candidate = candidates[k]
+            if is_bytes:
+                matches.append((spans[k][0], candidate.decode('ascii'),
+                                digits[k].decode('ascii')))
+            else:
+                # The finding keeps non-ASCII digits as written
+                matches.append((spans[k][0], candidate, _STRIP_RE.sub('', candidate)))
+        return matches
+
+    def _finding(self, position: int, candidate: str, clean_number: str,
+                 encoding: str = 'plain') -> Dict:
+        """
+        Builds the finding dict for one match from _match_spans. Callers add
+        the location keys with plain item stores, which beat both update()
+        from a shared per-file dict and building the dict in one literal.
+        """
+        return {
+            'original_format': candidate,
+            'masked_number': f"{clean_number[:6]}...{clean_number[-4:]}",
+            'card_brand': self.identify_card_brand(clean_number),
+            'position': position,
+            'length': len(clean_number),
+            'detected_encoding': encoding,
+        }
+
+    def _match_card_numbers(self, text: str, encoding: str = 'plain') -> List[Dict]:
+        """
+        Scans a single string, returning findings tagged with *encoding* so
+        callers know the source.
+        """
+        return [self._finding(start, candidate, clean_number, encoding)
+                for start, candidate, clean_number in self._match_spans(text)]
 
     def find_card_numbers(self, text: str) -> List[Dict]:
         """
@@ -292,24 +961,161 @@ class CreditCardDetector:
         original text, or the scheme name when found after decoding).
 
         Args:
-            text: Text to search
+            text: Text to search, as str or UTF-8 bytes. ASCII bytes are
+                  scanned without decoding; other bytes are decoded the way
+                  the file readers do (undecodable bytes dropped), so
+                  positions always count characters.
 
         Returns:
             List of dicts containing found card numbers and metadata
         """
+        if not isinstance(text, str):
+            text = bytes(text)
+            if self.decode_mode or not text.isascii():
+                text = text.decode('utf-8', errors='ignore')
+
         findings = self._match_card_numbers(text, encoding='plain')
 
         if self.decode_mode:
             seen_numbers = {f['masked_number'] for f in findings}
             for decoded_text, encoding in self._decode_variants(text):
-                for finding in self._match_card_numbers(decoded_text, encoding):
+                for start, candidate, clean_number in self._match_spans(decoded_text):
                     # Avoid reporting the same card number twice for this chunk
-                    if finding['masked_number'] not in seen_numbers:
-                        seen_numbers.add(finding['masked_number'])
-                        findings.append(finding)
+                    masked = f"{clean_number[:6]}...{clean_number[-4:]}"
+                    if masked not in seen_numbers:
+                        seen_numbers.add(masked)
+                        findings.append(
+                            self._finding(start, candidate, clean_number, encoding)
+                        )
 
         return findings
 
+    def _match_cells(self, cells: List[str]) -> List[Tuple[int, Dict]]:
+        """
+        Scans many short strings (CSV cells, database values) in one regex call.
+
+        The cells are joined with '\\x01', which is neither a digit nor a
+        separator, so no match can straddle two cells and the joins act as
+        word boundaries just like the ends of a string. Returns
+        (cell_index, finding) pairs, with 'position' relative to the cell.
+        Plain matching only; decode mode needs each cell on its own.
+        """
+        matches = self._match_spans('\x01'.join(cells))
+        if not matches:
+            return []
+
+        offsets = [0]
+        offsets.extend(accumulate(len(cell) + 1 for cell in cells))
+        located = []
+        for start, candidate, clean_number in matches:
+            idx = bisect_right(offsets, start) - 1
+            located.append(
+                (idx, self._finding(start - offsets[idx], candidate, clean_number))
+            )
+        return located
+
+    def _scan_text_block(self, block, first_line: int, file_path: str,
+                         findings: List[Dict]) -> int:
+        """
+        Scans a block of whole '\\n'-terminated lines (str, or ASCII bytes) in
+        one regex call, appending findings located by line. Returns the line
+        number following the block.
+        """
+        is_bytes = isinstance(block, bytes)
+        newline = b'\n' if is_bytes else '\n'
+        line_num = first_line
+        counted = 0
+        line_start = 0
+        line_end = -1
+        for start, candidate, clean_number in self._match_spans(block, _LINE_CANDIDATES):
+            # Matches arrive in order, so each newline is searched for once;
+            # a long line holding many matches isn't rescanned per match
+            if start > line_end:
+                crossed = block.count(newline, counted, start)
+                if crossed:
+                    line_num += crossed
+                    line_start = block.rfind(newline, counted, start) + 1
+                line_end = block.find(newline, start)
+                if line_end < 0:
+                    line_end = len(block)
+                context = _line_context(block, line_start, line_end)
+            counted = start
+            finding = self._finding(start - line_start, candidate, clean_number)
+            finding['file'] = file_path
+            finding['line'] = line_num
+            finding['context'] = context
+            findings.append(finding)
+        return first_line + block.count(newline)
+
+    def _scan_byte_block(self, block: bytes, first_line: int, file_path: str,
+                         findings: List[Dict]) -> int:
+        """
+        Scans a block of whole lines of raw UTF-8 file content, with the same
+        results as reading it in text mode (errors='ignore', universal
+        newlines). Pure-ASCII blocks — the common case for logs and dumps —
+        are scanned as bytes and never decoded.
+        """
+        if not block.isascii():
+            # Decode before translating newlines: dropped bytes may sit
+            # between a '\\r' and a '\\n', as in text mode
+            text = block.decode('utf-8', errors='ignore')
+            if '\r' in text:
+                text = text.replace('\r\n', '\n').replace('\r', '\n')
+            return self._scan_text_block(text, first_line, file_path, findings)
+
+        if b'\r' in block:
+            block = block.replace(b'\r\n', b'\n').replace(b'\r', b'\n')
+        return self._scan_text_block(block, first_line, file_path, findings)
+
+    def _scan_byte_chunks(self, chunks, file_path: str,
+                          findings: List[Dict]) -> None:
+        """
+        Scans raw file content arriving in arbitrary byte chunks, re-cut at
+        line ends like _scan_text_chunks. A lone '\\r' only ends a block when
+        an ASCII byte follows it, so no '\\r\\n' pair (even one with invalid
+        bytes in between) is ever split.
+        """
+        line_num = 1
+        pending: List[bytes] = []
+        for chunk in chunks:
+            cut = chunk.rfind(b'\n') + 1
+            cr = chunk.rfind(b'\r', cut, len(chunk) - 1)
+            if cr >= 0 and chunk[cr + 1] < 0x80:
+                cut = cr + 1
+            if not cut:
+                pending.append(chunk)
+                continue
+            pending.append(chunk[:cut])
+            line_num = self._scan_byte_block(b''.join(pending), line_num,
+                                             file_path, findings)
+            pending = [chunk[cut:]]
+        tail = b''.join(pending)
+        if tail:
+            self._scan_byte_block(tail, line_num, file_path, findings)
+
+    def _scan_text_chunks(self, chunks, file_path: str,
+                          findings: List[Dict]) -> None:
+        """
+        Scans text arriving in arbitrary chunks, appending findings by line.
+
+        Chunks are re-cut at their last newline so every regex call covers
+        whole lines — one call per chunk instead of one per line.
+        """
+        line_num = 1
+        pending: List[str] = []
+        for chunk in chunks:
+            cut = chunk.rfind('\n') + 1
+            if not cut:
+                pending.append(chunk)
+                continue
+            pending.append(chunk[:cut])
+            line_num = self._scan_text_block(''.join(pending), line_num,
+                                             file_path, findings)
+            pending = [chunk[cut:]]
+        tail = ''.join(pending)
+        if tail:
+            self._scan_text_block(tail, line_num, file_path, findings)
+
     # ── File scanners ─────────────────────────────────────────────────────────
 
     def scan_csv(self, csv_path: str, delimiter: str = ',') -> List[Dict]:
@@ -325,20 +1131,124 @@ class CreditCardDetector:
         """
         findings = []
         try:
-            with open(csv_path, 'r', encoding='utf-8', errors='ignore') as f:
-                reader = csv.reader(f, delimiter=delimiter)
-                for row_num, row in enumerate(reader, start=1):
-                    for col_num, cell in enumerate(row, start=1):
-                        for finding in self.find_card_numbers(str(cell)):
-                            finding['file'] = csv_path
-                            finding['row'] = row_num
-                            finding['column'] = col_num
-                            finding['cell_content'] = cell[:50]
-                            findings.append(finding)
+            if (HAS_ARROW and not self.decode_mode
+                    and self._scan_csv_arrow(csv_path, delimiter, findings)):
+                return findings
+            with open(csv_path, 'r', encoding='utf-8', errors='ignore',
+                      buffering=_READ_BUFFER_BYTES) as f:
+                self._scan_csv_lines(f, csv_path, delimiter, findings)
         except Exception as e:
             print(f"Error scanning {csv_path}: {e}")
         return findings
 
+    def _scan_csv_arrow(self, csv_path: str, delimiter: str,
+                        findings: List[Dict]) -> bool:
+        """
+        Plain-mode scan_csv on pyarrow: the file is parsed in C, batch by
+        batch, and a vectorised RE2 match per column picks out the few cells
+        with digit runs that could form a card number. Only those cells ever
+        become Python strings.
+
+        Returns False, having added nothing, for files Arrow would not split
+        or decode exactly as csv.reader does in text mode (lone carriage
+        returns, a byte-order mark, invalid UTF-8, rows of differing widths,
+        ...), so the caller can fall back to it.
+        """
+        if len(delimiter) != 1 or not delimiter.isascii():
+            return False
+        with open(csv_path, 'rb') as f:
+            try:
+                with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as view:
+                    if view[:3] == codecs.BOM_UTF8 or _LONE_CR_RE.search(view):
+                        return False
+                    crlf = view.find(b'\r') >= 0
+            except (ValueError, OSError):
+                return False  # empty, or not mappable
+
+        # Typing every column as a string keeps Arrow from converting
+        # numeric-looking cells; the first record gives the column count
+        with open(csv_path, 'r', encoding='utf-8', errors='ignore') as f:
+            first = next(csv.reader(f, delimiter=delimiter), None)
+        if not first:
+            return False
+
+        found: List[Dict] = []
+        row_base = 1
+        try:
+            reader = pa_csv.open_csv(
+                csv_path,
+                read_options=pa_csv.ReadOptions(autogenerate_column_names=True),
+                parse_options=pa_csv.ParseOptions(
+                    delimiter=delimiter, newlines_in_values=True,
+                    ignore_empty_lines=False),
+                convert_options=pa_csv.ConvertOptions(
+                    column_types={f'f{i}': pa.string() for i in range(len(first))},
+                    strings_can_be_null=False, quoted_strings_can_be_null=False),
+            )
+            for batch in reader:
+                hits: List[Tuple[int, int, str]] = []
+                for col_idx, column in enumerate(batch.columns):
+                    mask = pa_compute.match_substring_regex(column, _ARROW_DIGIT_RUNS)
+                    rows = pa_compute.indices_nonzero(mask).to_pylist()
+                    if rows:
+                        values = column.take(rows).to_pylist()
+                        if crlf:
+                            values = [v.replace('\r\n', '\n') for v in values]
+                        hits.extend(zip(rows, [col_idx] * len(rows), values))
+                hits.sort(key=lambda hit: (hit[0], hit[1]))
+                for idx, finding in self._match_cells([hit[2] for hit in hits]):
+                    row, col_idx, cell = hits[idx]
+                    finding['file'] = csv_path
+                    finding['row'] = row_base + row
+                    finding['column'] = col_idx + 1
+                    finding['cell_content'] = cell[:50]
+                    found.append(finding)
+                row_base += batch.num_rows
+        except pa.ArrowInvalid:
+            return False
+        findings.extend(found)
+        return True
+
+    def _scan_csv_lines(self, lines, csv_path: str, delimiter: str,
+                        findings: List[Dict]) -> None:
+        """Scans CSV text given as an iterable of lines, appending findings."""
+        reader = csv.reader(lines, delimiter=delimiter)
+        if self.decode_mode:
+            for row_num, row in enumerate(reader, start=1):
+                for col_num, cell in enumerate(row, start=1):
+                    cell_findings = self.find_card_numbers(str(cell))
+                    if not cell_findings:
+                        continue
+                    snippet = cell[:50]
+                    for finding in cell_findings:
+                        finding['file'] = csv_path
+                        finding['row'] = row_num
+                        finding['column'] = col_num
+                        finding['cell_content'] = snippet
+                        findings.append(finding)
+            return
+
+        # Plain mode: scan rows in batches, one regex call per batch
+        cells: List[str] = []
+        where: List[Tuple[int, int]] = []
+
+        def flush():
+            for idx, finding in self._match_cells(cells):
+                finding['file'] = csv_path
+                finding['row'], finding['column'] = where[idx]
+                finding['cell_content'] = cells[idx][:50]
+                findings.append(finding)
+            cells.clear()
+            where.clear()
+
+        for row_num, row in enumerate(reader, start=1):
+            for col_num, cell in enumerate(row, start=1):
+                cells.append(cell)
+                where.append((row_num, col_num))
+            if len(cells) >= _BATCH_CELLS:
+                flush()
+        flush()
+
     def scan_text_file(self, file_path: str) -> List[Dict]:
         """
         Scans a text file for credit card numbers.
@@ -352,17 +1262,65 @@ class CreditCardDetector:
         """
         findings = []
         try:
-            with open(file_path, 'r', encoding='utf-8', errors='ignore') as f:
-                for line_num, line in enumerate(f, start=1):
-                    for finding in self.find_card_numbers(line):
-                        finding['file'] = file_path
-                        finding['line'] = line_num
-                        finding['context'] = line.strip()[:100]
-                        findings.append(finding)
+            if self.decode_mode:
+                with open(file_path, 'r', encoding='utf-8', errors='ignore',
+                          buffering=_READ_BUFFER_BYTES) as f:
+                    chunks = iter(lambda: f.read(_CHUNK_CHARS), '')
+                    self._scan_text_lines(chunks, file_path, findings)
+                return findings
+
+            # Plain mode: scan the memory-mapped bytes, decoding only the
+            # blocks that aren't pure ASCII
+            with open(file_path, 'rb') as f:
+                try:
+                    source = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+                except (ValueError, OSError):
+                    source = f  # empty or not mappable (pipes, some network FS)
+                with source:
+                    chunks = iter(lambda: source.read(_CHUNK_CHARS), b'')
+                    self._scan_byte_chunks(chunks, file_path, findings)
         except Exception as e:
             print(f"Error scanning {file_path}: {e}")
         return findings
 
+    def scan_text_stream(self, chunks, source: str) -> List[Dict]:
+        """
+        Scans text arriving as an iterable of string chunks (e.g. decoded from
+        a network stream) without storing it anywhere first.
+
+        Args:
+            chunks: Iterable of str chunks; lines may span chunk boundaries
+            source: Value recorded in each finding's 'file' field
+
+        Returns:
+            List of findings with line and context information
+        """
+        findings = []
+        try:
+            self._scan_text_lines(chunks, source, findings)
+        except Exception as e:
+            print(f"Error scanning {source}: {e}")
+        return findings
+
+    def _scan_text_lines(self, chunks, file_path: str,
+                         findings: List[Dict]) -> None:
+        """Scans chunked text line by line, appending findings."""
+        if not self.decode_mode:
+            # Plain mode: one regex call per multi-megabyte chunk
+            self._scan_text_chunks(chunks, file_path, findings)
+            return
+
+        for line_num, line in enumerate(_iter_lines(chunks), start=1):
+            line_findings = self.find_card_numbers(line)
+            if not line_findings:
+                continue
+            context = line.strip()[:100]
+            for finding in line_findings:
+                finding['file'] = file_path
+                finding['line'] = line_num
+                finding['context'] = context
+                findings.append(finding)
+
     def scan_pdf(self, pdf_path: str) -> List[Dict]:
         """
         Scans a PDF file for credit card numbers by extracting text page by page.
@@ -387,11 +1345,15 @@ class CreditCardDetector:
                     if not text:
                         continue
                     for line_num, line in enumerate(text.split('\n'), start=1):
-                        for finding in self.find_card_numbers(line):
+                        line_findings = self.find_card_numbers(line)
+                        if not line_findings:
+                            continue
+                        context = line.strip()[:100]
+                        for finding in line_findings:
                             finding['file'] = pdf_path
                             finding['page'] = page_num
                             finding['line'] = line_num
-                            finding['context'] = line.strip()[:100]
+                            finding['context'] = context
                             findings.append(finding)
         except Exception as e:
             print(f"Error scanning {pdf_path}: {e}")
@@ -414,25 +1376,53 @@ class CreditCardDetector:
             return []
 
         findings = []
+        cells: List[str] = []
+        where: List[Tuple[str, int, int]] = []
+
+        def flush():
+            for idx, finding in self._match_cells(cells):
+                finding['file'] = excel_path
+                finding['sheet'], finding['row'], finding['column'] = where[idx]
+                finding['cell_content'] = cells[idx][:50]
+                findings.append(finding)
+            cells.clear()
+            where.clear()
+
         try:
             wb = openpyxl.load_workbook(excel_path, read_only=True, data_only=True)
             for sheet_name in wb.sheetnames:
                 sheet = wb[sheet_name]
-                for row_num, row in enumerate(sheet.iter_rows(), start=1):
-                    for col_num, cell in enumerate(row, start=1):
-                        if cell.value is None:
+                # values_only skips building a Cell object per cell
+                for row_num, row in enumerate(sheet.iter_rows(values_only=True), start=1):
+                    for col_num, value in enumerate(row, start=1):
+                        if value is None:
+                            continue
+                        if (isinstance(value, (int, float))
+                                and not _number_may_hold_card(value)):
+                            continue
+                        cell_str = value if isinstance(value, str) else str(value)
+                        if not self.decode_mode:
+                            # Plain mode: one regex call per batch of cells
+                            cells.append(cell_str)
+                            where.append((sheet_name, row_num, col_num))
+                            continue
+                        cell_findings = self.find_card_numbers(cell_str)
+                        if not cell_findings:
                             continue
-                        cell_str = str(cell.value)
-                        for finding in self.find_card_numbers(cell_str):
+                        snippet = cell_str[:50]
+                        for finding in cell_findings:
                             finding['file'] = excel_path
                             finding['sheet'] = sheet_name
                             finding['row'] = row_num
                             finding['column'] = col_num
-                            finding['cell_content'] = cell_str[:50]
+                            finding['cell_content'] = snippet
                             findings.append(finding)
+                    if len(cells) >= _BATCH_CELLS:
+                        flush()
             wb.close()
         except Exception as e:
             print(f"Error scanning {excel_path}: {e}")
+        flush()
         return findings
 
     def _scan_file_by_extension(self, local_path: str, ext: str,
@@ -447,6 +1437,11 @@ class CreditCardDetector:
             findings = self.scan_excel(local_path)
         elif ext == '.pdf':
             findings = self.scan_pdf(local_path)
+        elif ext not in SCANNABLE_EXTENSIONS and _looks_binary(local_path):
+            # Only caller-added extensions are sniffed: a known text format
+            # with a stray NUL (e.g. a log padded after copytruncate) is
+            # still scanned
+            findings = []
         else:
             findings = self.scan_text_file(local_path)
 
@@ -455,32 +1450,218 @@ class CreditCardDetector:
                 f['file'] = source
         return findings
 
-    def scan_directory(self, directory: str, extensions: List[str] = None) -> List[Dict]:
+    def _scan_stream_by_extension(self, byte_chunks, ext: str,
+                                  source: str) -> List[Dict]:
+        """
+        Routes a UTF-8 byte stream in one of the _STREAMABLE_EXTENSIONS
+        formats to the CSV or text scanner, recording source as the 'file'.
+        """
+        chunks = _decode_stream(byte_chunks)
+        if ext != '.csv':
+            return self.scan_text_stream(chunks, source)
+
+        findings = []
+        try:
+            self._scan_csv_lines(_iter_lines(chunks), source, ',', findings)
+        except Exception as e:
+            print(f"Error scanning {source}: {e}")
+        return findings
+
+    def scan_directory(self, directory: str, extensions: List[str] = None,
+                       jobs: int = None) -> List[Dict]:
         """
         Recursively scans a directory for files containing card numbers.
 
+        Files are scanned in parallel across CPU cores with a process pool;
+        findings are returned in the same order as a sequential scan. If the
+        pool can't start or breaks (e.g. a spawn-platform script without an
+        `if __name__ == "__main__":` guard), the remaining files are scanned
+        in-process.
+
         Args:
             directory: Directory path to scan
             extensions: File extensions to scan. Defaults to all supported types
                         including PDF and Excel.
+            jobs: Number of worker processes. Defaults to the CPU count;
+                  1 scans in-process.
 
         Returns:
             List of all findings
         """
         if extensions is None:
-            extensions = list(SCANNABLE_EXTENSIONS)
+            extensions = SCANNABLE_EXTENSIONS
+
+        paths = list(_iter_files(str(Path(directory)), frozenset(extensions)))
 
         all_findings = []
-        for file_path in Path(directory).rglob('*'):
-            if file_path.is_file() and file_path.suffix.lower() in extensions:
-                print(f"Scanning: {file_path}")
-                all_findings.extend(
-                    self._scan_file_by_extension(str(file_path), file_path.suffix.lower())
-                )
+        done = 0
+        workers = jobs or os.cpu_count() or 1
+        if workers >= 2 and len(paths) >= _PARALLEL_MIN_FILES:
+            # Small chunks keep workers evenly loaded when file sizes vary
+            chunksize = max(1, min(16, len(paths) // (workers * 4)))
+            try:
+                with ProcessPoolExecutor(max_workers=workers,
+                                         initializer=_init_scan_worker,
+                                         initargs=(type(self), self.decode_mode)) as pool:
+                    for path, findings in zip(paths, pool.map(_scan_one, paths,
+                                                              chunksize=chunksize)):
+                        print(f"Scanning: {path}")
+                        all_findings.extend(findings)
+                        done += 1
+            except (BrokenProcessPool, OSError, RuntimeError, NotImplementedError) as e:
+                print(f"Process pool unavailable ({e}), scanning in-process")
+
+        for path in paths[done:]:
+            print(f"Scanning: {path}")
+            all_findings.extend(
+                self._scan_file_by_extension(path, Path(path).suffix.lower())
+            )
         return all_findings
 
     # ── Database scanners ─────────────────────────────────────────────────────
 
+    def _fetch_rows(self, conn, open_cursor, query: str, matches: List[str],
+                    numbered: bool = False):
+        """
+        Streams the rows of query as (row_id, cells) pairs. The first column
+        of query is the row id unless numbered is set, in which case rows are
+        numbered from 1 in result order.
+
+        Each query runs on a fresh cursor from open_cursor, which is iterated
+        rather than fetchall()-ed, so with a server-side cursor memory stays
+        bounded by one fetch batch whatever the row limit.
+
+        In plain mode (unless db_prefilter is off) the database first drops
+        rows where none of the match conditions hold, so cells that cannot
+        contain a card number never reach Python. The filter wraps query in a
+        subquery, so the same LIMIT-ed rows (and row numbers) are considered
+        either way. If the server rejects it, the unfiltered query is used.
+        """
+        cur = None
+        if self.db_prefilter and not self.decode_mode and matches:
+            inner = (f'SELECT ROW_NUMBER() OVER () AS row_num, numbered.* '
+                     f'FROM ({query}) AS numbered' if numbered else query)
+            cur = open_cursor()
+            try:
+                cur.execute(f'SELECT * FROM ({inner}) AS candidates '
+                            f'WHERE {" OR ".join(matches)}')
+                numbered = False
+            except Exception:
+                conn.rollback()
+                cur = None
+        if cur is None:
+            cur = open_cursor()
+            cur.execute(query)
+        try:
+            if numbered:
+                yield from enumerate(cur, start=1)
+            else:
+                for row in cur:
+                    yield row[0], row[1:]
+        finally:
+            cur.close()
+
+    def _copy_rows(self, conn, query: str, matches: List[str], consume) -> None:
+        """
+        Streams the result of query through COPY ... TO STDOUT, passing
+        batches of rows (lists of strings, NULL as '') to consume(). The
+        database prefilter applies as in _fetch_rows, and the unfiltered
+        query is used if the server rejects it before any rows arrive.
+        """
+        def copy(select: str, sink: _CopyRowSink) -> None:
+            cur = conn.cursor()
+            try:
+                cur.copy_expert(f"COPY ({select}) TO STDOUT "
+                                f"WITH (FORMAT csv, ENCODING 'UTF8')", sink)
+            finally:
+                cur.close()
+            sink.close()
+
+        if self.db_prefilter and not self.decode_mode and matches:
+            sink = _CopyRowSink(consume)
+            try:
+                copy(f'SELECT * FROM ({query}) AS candidates '
+                     f'WHERE {" OR ".join(matches)}', sink)
+                return
+            except Exception:
+                if sink.started:
+                    raise
+                conn.rollback()
+        copy(query, _CopyRowSink(consume))
+
+    def _scan_rows(self, rows, columns: List[str], source: str, table: str,
+                   findings: List[Dict]) -> None:
+        """
+        Scans (row_id, cells) pairs fetched from one table, appending findings.
+        In plain mode cells are batched so one regex call covers many rows.
+        """
+        if self.decode_mode:
+            for row_id, row in rows:
+                for col_idx, cell_value in enumerate(row):
+                    if cell_value is None:
+                        continue
+                    for finding in self.find_card_numbers(str(cell_value)):
+                        finding['source'] = source
+                        finding['table'] = table
+                        finding['column'] = columns[col_idx]
+                        finding['row_id'] = row_id
+                        findings.append(finding)
+            return
+
+        cells: List[str] = []
+        where: List[Tuple] = []
+
+        def flush():
+            for idx, finding in self._match_cells(cells):
+                row_id, col_idx = where[idx]
+                finding['source'] = source
+                finding['table'] = table
+                finding['column'] = columns[col_idx]
+                finding['row_id'] = row_id
+                findings.append(finding)
+            cells.clear()
+            where.clear()
+
+        for row_id, row in rows:
+            for col_idx, cell_value in enumerate(row):
+                if cell_value is None:
+                    continue
+                cells.append(str(cell_value))
+                where.append((row_id, col_idx))
+            if len(cells) >= _BATCH_CELLS:
+                flush()
+        flush()
+
+    @staticmethod
+    def _add_connections(conns: list, count: int, connect) -> None:
+        """
+        Opens connections with connect() until conns holds count of them.
+        Stops at the first refusal (e.g. a per-user connection limit), so the
+        scan goes on with fewer workers instead of failing.
+        """
+        while len(conns) < count:
+            try:
+                conns.append(connect())
+            except Exception as e:
+                print(f"  Scanning over {len(conns)} connection(s): {e}")
+                return
+
+    @staticmethod
+    def _scan_tables(table_columns: Dict[str, List[str]], workers: int,
+                     scan_table) -> List[Dict]:
+        """
+        Runs scan_table(table, columns) for every table, up to workers at a
+        time on a thread pool, so one table's round trips overlap another's
+        scanning. Findings are returned in table order either way.
+        """
+        items = list(table_columns.items())
+        if workers < 2 or len(items) < 2:
+            results = [scan_table(table, columns) for table, columns in items]
+        else:
+            with ThreadPoolExecutor(max_workers=min(workers, len(items))) as pool:
+                results = list(pool.map(lambda item: scan_table(*item), items))
+        return [finding for table_findings in results for finding in table_findings]
+
     def scan_sqlite(self, db_path: str, row_limit: int = 10000) -> List[Dict]:
         """
         Scans all tables in a SQLite database for credit card numbers.
@@ -509,18 +1690,10 @@ class CreditCardDetector:
                     continue
 
                 try:
-                    cur.execute(f'SELECT rowid, * FROM "{table}" LIMIT {row_limit}')
-                    for row in cur.fetchall():
-                        rowid = row[0]
-                        for col_idx, cell_value in enumerate(row[1:]):
-                            if cell_value is None:
-                                continue
-                            for finding in self.find_card_numbers(str(cell_value)):
-                                finding['source'] = source
-                                finding['table'] = table
-                                finding['column'] = columns[col_idx]
-                                finding['row_id'] = rowid
-                                findings.append(finding)
+                    query = f'SELECT rowid, * FROM "{table}" LIMIT {row_limit}'
+                    matches = [_SQLITE_DIGIT_RUNS.format(col=f'"{c}"') for c in columns]
+                    rows = self._fetch_rows(conn, conn.cursor, query, matches)
+                    self._scan_rows(rows, columns, source, table, findings)
                 except Exception as e:
                     print(f"  Error scanning table '{table}': {e}")
 
@@ -531,9 +1704,12 @@ class CreditCardDetector:
 
     def scan_postgres(self, host: str, dbname: str, user: str, password: str,
                       port: int = 5432, schema: str = 'public',
-                      row_limit: int = 10000) -> List[Dict]:
+                      row_limit: int = 10000,
+                      pool_size: int = _DB_POOL_SIZE) -> List[Dict]:
         """
         Scans text columns in a PostgreSQL database for credit card numbers.
+        Tables are scanned concurrently over a pool of connections, and each
+        connection lets the server scan a large table with parallel workers.
 
         Requires: pip install psycopg2-binary
 
@@ -542,6 +1718,7 @@ class CreditCardDetector:
             port:      PostgreSQL port (default: 5432)
             schema:    Schema to scan (default: public)
             row_limit: Maximum rows to scan per table (default: 10 000)
+            pool_size: Maximum concurrent connections (default: 25)
 
         Returns:
             List of findings with table, column, and ctid location
@@ -552,11 +1729,19 @@ class CreditCardDetector:
 
         findings = []
         source = f"postgres:{host}/{dbname}"
+        params = dict(host=host, port=port, dbname=dbname, user=user,
+                      password=password)
         try:
-            conn = psycopg2.connect(host=host, port=port, dbname=dbname,
-                                    user=user, password=password)
-            cur = conn.cursor()
-
+            try:
+                conns = [psycopg2.connect(options=_PG_SESSION_OPTIONS, **params)]
+                params['options'] = _PG_SESSION_OPTIONS
+            except psycopg2.Error:
+                conns = [psycopg2.connect(**params)]
+        except Exception as e:
+            print(f"Error connecting to PostgreSQL {host}/{dbname}: {e}")
+            return findings
+        try:
+            cur = conns[0].cursor()
             cur.execute("""
                 SELECT table_name, column_name
                 FROM information_schema.columns
@@ -569,36 +1754,58 @@ class CreditCardDetector:
             table_columns: Dict[str, List[str]] = {}
             for table, column in cur.fetchall():
                 table_columns.setdefault(table, []).append(column)
+            cur.close()
+            conns[0].rollback()
+
+            self._add_connections(conns, min(pool_size, len(table_columns)),
+                                  lambda: psycopg2.connect(**params))
+            idle = queue.SimpleQueue()
+            for conn in conns:
+                idle.put(conn)
+
+            def scan_table(table: str, columns: List[str]) -> List[Dict]:
+                table_findings: List[Dict] = []
+                conn = idle.get()
+
+                def consume(records):
+                    rows = ((record[0], record[1:]) for record in records)
+                    self._scan_rows(rows, columns, source, f"{schema}.{table}",
+                                    table_findings)
 
-            for table, columns in table_columns.items():
                 col_list = ', '.join(f'"{c}"' for c in columns)
                 try:
-                    cur.execute(
-                        f'SELECT ctid, {col_list} FROM "{schema}"."{table}" LIMIT {row_limit}'
-                    )
-                    for row in cur.fetchall():
-                        ctid = row[0]
-                        for col_idx, cell_value in enumerate(row[1:]):
-                            if cell_value is None:
-                                continue
-                            for finding in self.find_card_numbers(str(cell_value)):
-                                finding['source'] = source
-                                finding['table'] = f"{schema}.{table}"
-                                finding['column'] = columns[col_idx]
-                                finding['row_id'] = str(ctid)
-                                findings.append(finding)
+                    query = (f'SELECT ctid, {col_list} FROM "{schema}"."{table}" '
+                             f'LIMIT {row_limit}')
+                    matches = [f'"{c}" ~ {_SQL_DIGIT_RUNS} OR '
+                               + _SQL_NON_ASCII.format(col=f'"{c}"')
+                               for c in columns]
+                    self._copy_rows(conn, query, matches, consume)
                 except Exception as e:
                     print(f"  Error scanning {schema}.{table}: {e}")
+                finally:
+                    # End the table's transaction before the next table uses
+                    # this connection; a broken one fails that table instead
+                    try:
+                        conn.rollback()
+                    except Exception:
+                        pass
+                    idle.put(conn)
+                return table_findings
 
-            conn.close()
+            findings = self._scan_tables(table_columns, len(conns), scan_table)
         except Exception as e:
             print(f"Error connecting to PostgreSQL {host}/{dbname}: {e}")
+        finally:
+            for conn in conns:
+                conn.close()
         return findings
 
     def scan_mysql(self, host: str, database: str, user: str, password: str,
-                   port: int = 3306, row_limit: int = 10000) -> List[Dict]:
+                   port: int = 3306, row_limit: int = 10000,
+                   pool_size: int = _DB_POOL_SIZE) -> List[Dict]:
         """
         Scans text columns in a MySQL database for credit card numbers.
+        Tables are scanned concurrently over a pool of connections.
 
         Requires: pip install mysql-connector-python
 
@@ -606,6 +1813,7 @@ class CreditCardDetector:
             host, database, user, password: Connection credentials
             port:      MySQL port (default: 3306)
             row_limit: Maximum rows to scan per table (default: 10 000)
+            pool_size: Maximum concurrent connections (default: 25)
 
         Returns:
             List of findings with table, column, and approximate row location
@@ -616,12 +1824,17 @@ class CreditCardDetector:
 
         findings = []
         source = f"mysql:{host}/{database}"
+        config = dict(
+            host=host, port=port, database=database,
+            user=user, password=password,
+            # Lets a table that fails mid-stream drop its unread rows
+            consume_results=True
+        )
+        # Every connection this scan opens, closed in the finally below
+        conns = []
         try:
-            conn = mysql.connector.connect(
-                host=host, port=port, database=database,
-                user=user, password=password
-            )
-            cur = conn.cursor()
+            conns.append(mysql.connector.connect(**config))
+            cur = conns[0].cursor()
 
             cur.execute("""
                 SELECT TABLE_NAME, COLUMN_NAME
@@ -635,27 +1848,41 @@ class CreditCardDetector:
             table_columns: Dict[str, List[str]] = {}
             for table, column in cur.fetchall():
                 table_columns.setdefault(table, []).append(column)
-
-            for table, columns in table_columns.items():
+            cur.close()
+
+            # One connection per worker, the metadata one included, handed
+            # out to tables as they start
+            self._add_connections(conns, min(pool_size, len(table_columns)),
+                                  lambda: mysql.connector.connect(**config))
+            idle = queue.SimpleQueue()
+            for conn in conns:
+                idle.put(conn)
+
+            def scan_table(table: str, columns: List[str]) -> List[Dict]:
+                table_findings: List[Dict] = []
+                table_conn = idle.get()
                 col_list = ', '.join(f'`{c}`' for c in columns)
                 try:
-                    cur.execute(f'SELECT {col_list} FROM `{table}` LIMIT {row_limit}')
-                    for row_num, row in enumerate(cur.fetchall(), start=1):
-                        for col_idx, cell_value in enumerate(row):
-                            if cell_value is None:
-                                continue
-                            for finding in self.find_card_numbers(str(cell_value)):
-                                finding['source'] = source
-                                finding['table'] = table
-                                finding['column'] = columns[col_idx]
-                                finding['row_id'] = row_num
-                                findings.append(finding)
+                    query = f'SELECT {col_list} FROM `{table}` LIMIT {row_limit}'
+                    matches = [f'`{c}` REGEXP {_SQL_DIGIT_RUNS} OR '
+                               + _SQL_NON_ASCII.format(col=f'`{c}`')
+                               for c in columns]
+                    rows = self._fetch_rows(table_conn,
+                                            lambda: table_conn.cursor(buffered=False),
+                                            query, matches, numbered=True)
+                    self._scan_rows(rows, columns, source, table, table_findings)
                 except Exception as e:
                     print(f"  Error scanning {table}: {e}")
+                finally:
+                    idle.put(table_conn)
+                return table_findings
 
-            conn.close()
+            findings = self._scan_tables(table_columns, len(conns), scan_table)
         except Exception as e:
             print(f"Error connecting to MySQL {host}/{database}: {e}")
+        finally:
+            for conn in conns:
+                conn.close()
         return findings
 
     # ── Cloud storage scanners ────────────────────────────────────────────────
@@ -697,24 +1924,24 @@ class CreditCardDetector:
 
         try:
             paginator = s3.get_paginator('list_objects_v2')
-            with tempfile.TemporaryDirectory() as tmpdir:
+
+            def objects():
                 for page in paginator.paginate(Bucket=bucket, Prefix=prefix):
                     for obj in page.get('Contents', []):
                         key = obj['Key']
-                        ext = Path(key).suffix.lower()
-                        if ext not in SCANNABLE_EXTENSIONS:
-                            continue
+                        if Path(key).suffix.lower() in SCANNABLE_EXTENSIONS:
+                            yield key, key, f"s3://{bucket}/{key}", obj.get('Size')
+
+            def body(key):
+                return s3.get_object(Bucket=bucket, Key=key)['Body']
 
-                        source = f"s3://{bucket}/{key}"
-                        local_path = os.path.join(tmpdir, Path(key).name)
-                        print(f"  Downloading: {source}")
-                        try:
-                            s3.download_file(bucket, key, local_path)
-                            findings.extend(
-                                self._scan_file_by_extension(local_path, ext, source)
-                            )
-                        except Exception as e:
-                            print(f"  Error processing {key}: {e}")
+            with tempfile.TemporaryDirectory() as tmpdir:
+                self._scan_cloud_objects(
+                    objects(), tmpdir, findings,
+                    download=lambda key, path: s3.download_file(bucket, key, path),
+                    read=lambda key: body(key).read(),
+                    stream=lambda key: body(key).iter_chunks(_STREAM_CHUNK_BYTES),
+                )
         except Exception as e:
             print(f"Error accessing S3 bucket '{bucket}': {e}")
         return findings
@@ -741,22 +1968,23 @@ class CreditCardDetector:
         findings = []
         try:
             client = gcs_storage.Client()
-            with tempfile.TemporaryDirectory() as tmpdir:
+
+            def objects():
                 for blob in client.list_blobs(bucket, prefix=prefix):
-                    ext = Path(blob.name).suffix.lower()
-                    if ext not in SCANNABLE_EXTENSIONS:
-                        continue
+                    if Path(blob.name).suffix.lower() in SCANNABLE_EXTENSIONS:
+                        yield blob, blob.name, f"gs://{bucket}/{blob.name}", blob.size
 
-                    source = f"gs://{bucket}/{blob.name}"
-                    local_path = os.path.join(tmpdir, Path(blob.name).name)
-                    print(f"  Downloading: {source}")
-                    try:
-                        blob.download_to_filename(local_path)
-                        findings.extend(
-                            self._scan_file_by_extension(local_path, ext, source)
-                        )
-                    except Exception as e:
-                        print(f"  Error processing {blob.name}: {e}")
+            def stream(blob):
+                with blob.open('rb') as reader:
+                    yield from iter(lambda: reader.read(_STREAM_CHUNK_BYTES), b'')
+
+            with tempfile.TemporaryDirectory() as tmpdir:
+                self._scan_cloud_objects(
+                    objects(), tmpdir, findings,
+                    download=lambda blob, path: blob.download_to_filename(path),
+                    read=lambda blob: blob.download_as_bytes(),
+                    stream=stream,
+                )
         except Exception as e:
             print(f"Error accessing GCS bucket '{bucket}': {e}")
         return findings
@@ -794,27 +2022,76 @@ class CreditCardDetector:
             service_client = BlobServiceClient.from_connection_string(connection_string)
             container_client = service_client.get_container_client(container)
 
-            with tempfile.TemporaryDirectory() as tmpdir:
+            def objects():
                 for blob in container_client.list_blobs(name_starts_with=prefix or None):
-                    ext = Path(blob.name).suffix.lower()
-                    if ext not in SCANNABLE_EXTENSIONS:
-                        continue
+                    if Path(blob.name).suffix.lower() in SCANNABLE_EXTENSIONS:
+                        yield (blob.name, blob.name,
+                               f"azure://{container}/{blob.name}", blob.size)
+
+            def download_blob(name):
+                return container_client.get_blob_client(name).download_blob()
+
+            def download(name, local_path):
+                with open(local_path, 'wb') as f:
+                    f.write(download_blob(name).readall())
+
+            with tempfile.TemporaryDirectory() as tmpdir:
+                self._scan_cloud_objects(
+                    objects(), tmpdir, findings,
+                    download=download,
+                    read=lambda name: download_blob(name).readall(),
+                    stream=lambda name: download_blob(name).chunks(),
+                )
+        except Exception as e:
+            print(f"Error accessing Azure container '{container}': {e}")
+        return findings
+
+    def _scan_cloud_objects(self, objects, tmpdir: str, findings: List[Dict],
+                            download, read, stream) -> None:
+        """
+        Scans cloud objects in listing order while the following ones are
+        fetched concurrently on a thread pool; scanning itself stays on the
+        calling thread. Errors are reported per object.
 
-                    source = f"azure://{container}/{blob.name}"
-                    local_path = os.path.join(tmpdir, Path(blob.name).name)
+        Args:
+            objects:  Iterable of (handle, name, source URI, size in bytes)
+            tmpdir:   Directory that receives PDF/Excel downloads
+            findings: List that findings are appended to
+            download: download(handle, local_path) saves an object to disk
+            read:     read(handle) returns an object's bytes
+            stream:   stream(handle) returns an iterable of its byte chunks
+        """
+        def fetch(item):
+            index, (handle, name, source, size) = item
+            if Path(name).suffix.lower() not in _STREAMABLE_EXTENSIONS:
+                local_path = os.path.join(tmpdir, f"{index}_{Path(name).name}")
+                download(handle, local_path)
+                return local_path
+            if size is not None and size <= _PREFETCH_MAX_BYTES:
+                return read(handle)
+            return None
+
+        ahead = _prefetch(fetch, enumerate(objects))
+        for (_, (handle, name, source, _)), fetched in ahead:
+            ext = Path(name).suffix.lower()
+            try:
+                if ext not in _STREAMABLE_EXTENSIONS:
                     print(f"  Downloading: {source}")
+                    local_path = fetched.result()
                     try:
-                        blob_client = container_client.get_blob_client(blob.name)
-                        with open(local_path, 'wb') as f:
-                            f.write(blob_client.download_blob().readall())
                         findings.extend(
                             self._scan_file_by_extension(local_path, ext, source)
                         )
-                    except Exception as e:
-                        print(f"  Error processing {blob.name}: {e}")
-        except Exception as e:
-            print(f"Error accessing Azure container '{container}': {e}")
-        return findings
+                    finally:
+                        os.remove(local_path)
+                    continue
+
+                print(f"  Streaming: {source}")
+                data = fetched.result()
+                chunks = [data] if data is not None else stream(handle)
+                findings.extend(self._scan_stream_by_extension(chunks, ext, source))
+            except Exception as e:
+                print(f"  Error processing {name}: {e}")
 
     # ── Reporting ─────────────────────────────────────────────────────────────
 
@@ -830,40 +2107,44 @@ class CreditCardDetector:
             print("\n[OK] No credit card numbers detected.")
             return
 
-        print(f"\n[WARNING] {len(findings)} potential credit card number(s) detected!\n")
-        print("=" * 80)
+        # The report is built as a list of lines and written in one call,
+        # rather than one print() per line
+        lines = [f"\n[WARNING] {len(findings)} potential credit card number(s) detected!\n",
+                 "=" * 80]
+        add = lines.append
 
         for i, finding in enumerate(findings, start=1):
-            print(f"\nFinding #{i}:")
+            add(f"\nFinding #{i}:")
 
             # Source label
             source = finding.get('source') or finding.get('file', 'N/A')
-            print(f"  Source   : {source}")
+            add(f"  Source   : {source}")
 
             # Location — varies by datasource
             if 'table' in finding:
-                print(f"  Location : Table={finding['table']}, "
-                      f"Column={finding['column']}, RowID={finding.get('row_id', 'N/A')}")
+                add(f"  Location : Table={finding['table']}, "
+                    f"Column={finding['column']}, RowID={finding.get('row_id', 'N/A')}")
             elif 'sheet' in finding:
-                print(f"  Location : Sheet={finding['sheet']}, "
-                      f"Row={finding['row']}, Column={finding['column']}")
+                add(f"  Location : Sheet={finding['sheet']}, "
+                    f"Row={finding['row']}, Column={finding['column']}")
             elif 'page' in finding:
-                print(f"  Location : Page={finding['page']}, "
-                      f"Line={finding.get('line', 'N/A')}")
+                add(f"  Location : Page={finding['page']}, "
+                    f"Line={finding.get('line', 'N/A')}")
             elif 'row' in finding:
-                print(f"  Location : Row={finding['row']}, Column={finding['column']}")
+                add(f"  Location : Row={finding['row']}, Column={finding['column']}")
             elif 'line' in finding:
-                print(f"  Location : Line={finding['line']}")
+                add(f"  Location : Line={finding['line']}")
 
-            print(f"  Masked   : {finding['masked_number']}")
-            print(f"  Brand    : {finding['card_brand']}")
-            print(f"  Format   : {finding['original_format']}")
-            print(f"  Length   : {finding['length']} digits")
+            add(f"  Masked   : {finding['masked_number']}")
+            add(f"  Brand    : {finding['card_brand']}")
+            add(f"  Format   : {finding['original_format']}")
+            add(f"  Length   : {finding['length']} digits")
             enc = finding.get('detected_encoding', 'plain')
             if enc and enc != 'plain':
-                print(f"  Encoding : {enc}  [found after decoding]")
+                add(f"  Encoding : {enc}  [found after decoding]")
 
-        print("\n" + "=" * 80)
+        add("\n" + "=" * 80)
+        sys.stdout.write('\n'.join(lines) + '\n')
 
         if output_path:
             self.save_report_csv(findings, output_path)
@@ -887,12 +2168,30 @@ class CreditCardDetector:
             'detected_encoding', 'context', 'cell_content',
         ]
 
-        with open(output_path, 'w', newline='', encoding='utf-8') as csvfile:
+        with open(output_path, 'w', newline='', encoding='utf-8',
+                  buffering=_WRITE_BUFFER_BYTES) as csvfile:
             writer = csv.DictWriter(csvfile, fieldnames=fieldnames, extrasaction='ignore')
             writer.writeheader()
             writer.writerows(findings)
 
 
+# ── Parallel directory scan workers ───────────────────────────────────────────
+
+# Each worker process builds its own detector once, in _init_scan_worker
+_worker_detector = None
+
+
+def _init_scan_worker(detector_class, decode_mode: bool):
+    """Process-pool initializer: creates the per-process detector."""
+    global _worker_detector
+    _worker_detector = detector_class(decode_mode=decode_mode)
+
+
+def _scan_one(path: str) -> List[Dict]:
+    """Process-pool task: scans a single file with the worker's detector."""
+    return _worker_detector._scan_file_by_extension(path, Path(path).suffix.lower())
+
+
 # ── CLI ───────────────────────────────────────────────────────────────────────
 
 def main():
@@ -911,6 +2210,7 @@ Examples:
   python card_detector.py --pdf invoice.pdf
   python card_detector.py --excel report.xlsx
   python card_detector.py --directory /path/to/data --output findings.csv
+  python card_detector.py --directory /path/to/data --jobs 4
 
   # Databases
   python card_detector.py --sqlite /var/db/app.db
@@ -937,6 +2237,8 @@ Examples:
                             help='Recursively scan all supported files in a directory')
     file_group.add_argument('--delimiter', default=',',
                             help='CSV delimiter (default: comma)')
+    file_group.add_argument('--jobs', metavar='N', type=int,
+                            help='Worker processes for --directory (default: CPU count)')
 
     # ── Database sources ──────────────────────────────────────────────────────
     db_group = parser.add_argument_group('Database sources')
@@ -951,6 +2253,8 @@ Examples:
     db_group.add_argument('--pg-password', metavar='PASSWORD', help='PostgreSQL password')
     db_group.add_argument('--pg-schema', metavar='SCHEMA', default='public',
                           help='PostgreSQL schema (default: public)')
+    db_group.add_argument('--pg-pool-size', metavar='N', type=int, default=_DB_POOL_SIZE,
+                          help=f'Max concurrent PostgreSQL connections (default: {_DB_POOL_SIZE})')
 
     db_group.add_argument('--mysql-host', metavar='HOST', help='MySQL host')
     db_group.add_argument('--mysql-port', metavar='PORT', type=int, default=3306,
@@ -958,9 +2262,14 @@ Examples:
     db_group.add_argument('--mysql-db', metavar='DBNAME', help='MySQL database name')
     db_group.add_argument('--mysql-user', metavar='USER', help='MySQL user')
     db_group.add_argument('--mysql-password', metavar='PASSWORD', help='MySQL password')
+    db_group.add_argument('--mysql-pool-size', metavar='N', type=int, default=_DB_POOL_SIZE,
+                          help=f'Max concurrent MySQL connections (default: {_DB_POOL_SIZE})')
 
     db_group.add_argument('--row-limit', metavar='N', type=int, default=10000,
                           help='Max rows to scan per database table (default: 10 000)')
+    db_group.add_argument('--no-prefilter', action='store_true',
+                          help='Fetch every row instead of letting the database '
+                               'skip rows without digit runs first')
 
     # ── Cloud storage sources ─────────────────────────────────────────────────
     cloud_group = parser.add_argument_group('Cloud storage sources')
@@ -1000,7 +2309,12 @@ Examples:
     )
 
     args = parser.parse_args()
-    detector = CreditCardDetector(decode_mode=args.decode_mode)
+    if args.jobs is not None and args.jobs < 1:
+        parser.error("--jobs must be at least 1")
+    if args.pg_pool_size < 1 or args.mysql_pool_size < 1:
+        parser.error("--pg-pool-size and --mysql-pool-size must be at least 1")
+    detector = CreditCardDetector(decode_mode=args.decode_mode,
+                                  db_prefilter=not args.no_prefilter)
     findings = []
 
     # ── Dispatch ──────────────────────────────────────────────────────────────
@@ -1023,7 +2337,7 @@ Examples:
 
     elif args.directory:
         print(f"Scanning directory: {args.directory}")
-        findings = detector.scan_directory(args.directory)
+        findings = detector.scan_directory(args.directory, jobs=args.jobs)
 
     elif args.sqlite:
         print(f"Scanning SQLite: {args.sqlite}")
@@ -1036,6 +2350,7 @@ Examples:
         findings = detector.scan_postgres(
             args.pg_host, args.pg_db, args.pg_user, args.pg_password,
             port=args.pg_port, schema=args.pg_schema, row_limit=args.row_limit,
+            pool_size=args.pg_pool_size,
         )
 
     elif args.mysql_host:
@@ -1045,6 +2360,7 @@ Examples:
         findings = detector.scan_mysql(
             args.mysql_host, args.mysql_db, args.mysql_user, args.mysql_password,
             port=args.mysql_port, row_limit=args.row_limit,
+            pool_size=args.mysql_pool_size,
         )
 
     elif args.s3_bucket:
@@ -2,7 +2,9 @@
 Test suite and examples for the Credit Card Detector
 """
 
-from card_detector import CreditCardDetector
+from card_detector import (CreditCardDetector, _luhn_sum, _luhn_table_sum,
+                           _CANDIDATE_RE, _CANDIDATES, _LINE_CANDIDATE_RE,
+                           _LINE_CANDIDATES)
 
 
 def test_luhn_algorithm():
@@ -163,6 +165,414 @@ def test_modern_bin_lengths():
     print("not individual components like BIN vs account number.\n")
 
 
+def test_luhn_table_sum():
+    """Test the lookup-table Luhn sum against the generic digit loop."""
+    print("Testing Lookup-Table Luhn Sum...")
+    print("=" * 50)
+
+    import random
+    rng = random.Random(13)
+
+    samples = ["".join(rng.choice("0123456789") for _ in range(length))
+               for length in range(13, 20) for _ in range(200)]
+
+    for card in samples:
+        digits = card.encode("ascii")
+        assert _luhn_table_sum(digits) % 10 == _luhn_sum(digits, len(digits)) % 10, \
+            f"Checksum mismatch for {card}"
+
+    print(f"\n✓ PASS: {len(samples)} numbers of 13-19 digits match the generic loop")
+    print("\n" + "=" * 50)
+    print("✓ Lookup-table Luhn confirmed!\n")
+
+
+def test_native_luhn():
+    """Test the native SWAR Luhn check against the lookup-table sum."""
+    print("Testing Native Luhn Check...")
+    print("=" * 50)
+
+    import card_detector
+    if not card_detector.HAS_NATIVE_SCANNER:
+        print("\n- SKIP: _scanner extension not built")
+        print("\n" + "=" * 50 + "\n")
+        return
+
+    import random
+    rng = random.Random(15)
+    alphabet = "0123456789" * 5 + "a -/"
+
+    samples = ["".join(rng.choice(alphabet) for _ in range(rng.randint(11, 21)))
+               for _ in range(20000)]
+    samples += ["".join(rng.choice("0123456789") for _ in range(16)) for _ in range(20000)]
+    samples += ["4111111111111111", "5425233430109903", "0000000000000000",
+                "9999999999999999", "999999999999999a", "5555555555554444"]
+
+    for card in samples:
+        digits = card.encode("ascii")
+        expected = (13 <= len(digits) <= 19 and digits.isdigit()
+                    and _luhn_table_sum(digits) % 10 == 0)
+        assert card_detector._native_luhn_valid(digits) == expected, \
+            f"Luhn mismatch for {card!r}"
+
+    print(f"\n✓ PASS: {len(samples)} inputs match the lookup-table Luhn")
+    print("\n" + "=" * 50)
+    print("✓ Native Luhn confirmed!\n")
+
+
+def test_luhn_batch():
+    """Test the batched Numba Luhn kernel against the lookup-table sum."""
+    print("Testing Batched Luhn Kernel...")
+    print("=" * 50)
+
+    import card_detector
+    if not card_detector.HAS_NUMBA:
+        print("\n- SKIP: numba not installed")
+        print("\n" + "=" * 50 + "\n")
+        return
+
+    import random
+    from itertools import accumulate
+    import numpy as np
+    rng = random.Random(16)
+    alphabet = "0123456789" * 5 + "a -/"
+
+    numbers = [b""] + ["".join(rng.choice(alphabet) for _ in range(rng.randint(11, 21))).encode("ascii")
+                       for _ in range(20000)]
+    ends = np.fromiter(accumulate(map(len, numbers)), np.int64, len(numbers))
+    valid = card_detector._luhn_batch(b"".join(numbers), ends)
+
+    for digits, result in zip(numbers, valid.tolist()):
+        expected = (13 <= len(digits) <= 19 and digits.isdigit()
+                    and _luhn_table_sum(digits) % 10 == 0)
+        assert result == expected, f"Luhn mismatch for {digits!r}"
+
+    print(f"\n✓ PASS: {len(numbers)} inputs match the lookup-table Luhn")
+    print("\n" + "=" * 50)
+    print("✓ Batched Luhn confirmed!\n")
+
+
+def test_bin_prefix_brands():
+    """Test the BIN-prefix brand table against CARD_PATTERNS."""
+    print("Testing BIN-Prefix Brand Table...")
+    print("=" * 50)
+
+    import random
+    import re
+    rng = random.Random(14)
+    patterns = [(brand, re.compile(pattern))
+                for brand, pattern in CreditCardDetector.CARD_PATTERNS.items()]
+    detector = CreditCardDetector()
+
+    checked = 0
+    for prefix in range(10000):
+        for length in range(13, 20):
+            card = f"{prefix:04d}" + "".join(rng.choice("0123456789")
+                                             for _ in range(length - 4))
+            expected = next((brand for brand, regex in patterns if regex.match(card)),
+                            "Unknown")
+            assert detector.identify_card_brand(card) == expected, \
+                f"Brand mismatch for {card}"
+            checked += 1
+
+    print(f"\n✓ PASS: {checked} prefix/length combinations match CARD_PATTERNS")
+    print("\n" + "=" * 50)
+    print("✓ BIN-prefix brand table confirmed!\n")
+
+
+def test_candidate_scanner_engines():
+    """Test that the installed scanning engine finds exactly what re finds."""
+    print("Testing Candidate Scanner Engines...")
+    print("=" * 50)
+
+    import random
+    rng = random.Random(12)
+    alphabet = "0123456789" * 4 + " -\t\n\r\x0b\x1c_aZ.,;"
+
+    samples = ["Card: 4111-1111-1111-1111", "a4111111111111111", "4111111111111111_",
+               "1234 5678 9012 3456 7890 1234", "41111111111111111111",
+               "4111\n1111\n1111\n1111", "6011-1111-1111-1117-", "", "1234"]
+    samples += ["".join(rng.choice(alphabet) for _ in range(rng.randint(0, 60)))
+                for _ in range(5000)]
+
+    for text in samples:
+        for scanner, regex in ((_CANDIDATES, _CANDIDATE_RE),
+                               (_LINE_CANDIDATES, _LINE_CANDIDATE_RE)):
+            expected = [m.span() for m in regex.finditer(text)]
+            assert scanner.spans(text) == expected, f"Span mismatch for {text!r}"
+
+    print(f"\n✓ PASS: {len(samples)} texts scanned identically to re")
+    print("\n" + "=" * 50)
+    print("✓ Candidate scanner confirmed!\n")
+
+
+def test_unicode_digits():
+    """Test that card numbers written in non-ASCII decimal digits are found."""
+    print("Testing Unicode Decimal Digits...")
+    print("=" * 50)
+
+    detector = CreditCardDetector()
+    samples = {
+        "card ４１１１１１１１１１１１１１１１ here": "４１１１１１...１１１１",
+        "٤١١١١١١١١١١١١١١١": "٤١١١١١...١١١١",
+        "ref ४१११ ११११ ११११ ११११.": "४१११११...११११",
+        "mixed 4111１１１１1111１１１１": "4111１１...１１１１",
+    }
+    for text, masked in samples.items():
+        findings = detector.find_card_numbers(text)
+        assert [f["masked_number"] for f in findings] == [masked], f"Missed {text!r}"
+        assert detector.luhn_check(findings[0]["original_format"])
+    assert not detector.find_card_numbers("card ４１１１１１１１１１１１１１１２ here")
+
+    print(f"\n✓ PASS: {len(samples)} non-ASCII digit numbers detected")
+    print("\n" + "=" * 50)
+    print("✓ Unicode digits confirmed!\n")
+
+
+def test_bytes_input():
+    """Test that find_card_numbers gives the same findings for bytes and str."""
+    print("Testing Bytes Input...")
+    print("=" * 50)
+
+    samples = ["Card: 4111-1111-1111-1111, Amex 378282246310005",
+               "Café № 5555 5555 5555 4444 — paid",
+               "no numbers here", ""]
+    for decode_mode in (False, True):
+        detector = CreditCardDetector(decode_mode=decode_mode)
+        for text in samples:
+            expected = detector.find_card_numbers(text)
+            assert detector.find_card_numbers(text.encode("utf-8")) == expected, \
+                f"Bytes mismatch for {text!r}"
+
+    print(f"\n✓ PASS: {len(samples)} samples match in plain and decode mode")
+    print("\n" + "=" * 50)
+    print("✓ Bytes input confirmed!\n")
+
+
+def test_chunked_text_file():
+    """Test that chunked text-file scanning matches a line-by-line scan."""
+    print("Testing Chunked Text File Scanning...")
+    print("=" * 50)
+
+    import os
+    import random
+    import tempfile
+    import card_detector
+    rng = random.Random(17)
+    pieces = [b"4111 1111 1111 1111", b"5555-5555-5555-4444", b"4111111111111112",
+              b"\r\n", b"\r", b"\n", b"\xff\xfe", b"\xe2\x82", b"\xc3\xa9",
+              b"   ", b"text ", b"2024-01-15", b"\t", b"378282246310005"]
+    samples = [
+        b"card 4111111111111111\r\nnext 5555555555554444\rlast 4111 1111 1111 1111",
+        b"bad \xff utf-8 4111\xff1111111111111111\n\xe9t\xe9 5555555555554444\n",
+        b" " * 150 + b"x" * 300 + b" 4111111111111111 " + b"y" * 200 + b"\n",
+        b"long " * 400 + b"4111-1111-1111-1111\r\n" + b"tail 5555 5555 5555 4444",
+    ]
+    samples += [b"".join(rng.choice(pieces) for _ in range(rng.randint(1, 120)))
+                for _ in range(200)]
+
+    original = card_detector._CHUNK_CHARS, card_detector._CONTEXT_HEAD_CHARS
+    card_detector._CHUNK_CHARS, card_detector._CONTEXT_HEAD_CHARS = 7, 101
+    try:
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "sample.log")
+            for data in samples:
+                with open(path, "wb") as f:
+                    f.write(data)
+                for decode_mode in (False, True):
+                    detector = CreditCardDetector(decode_mode=decode_mode)
+                    expected = []
+                    with open(path, "r", encoding="utf-8", errors="ignore") as f:
+                        for line_num, line in enumerate(f, start=1):
+                            for finding in detector.find_card_numbers(line):
+                                finding["file"] = path
+                                finding["line"] = line_num
+                                finding["context"] = line.strip()[:100]
+                                expected.append(finding)
+                    assert detector.scan_text_file(path) == expected, \
+                        f"Mismatch for {data!r} (decode_mode={decode_mode})"
+    finally:
+        card_detector._CHUNK_CHARS, card_detector._CONTEXT_HEAD_CHARS = original
+
+    print(f"\n✓ PASS: {len(samples)} files match a line-by-line scan")
+    print("\n" + "=" * 50)
+    print("✓ Chunked text scanning confirmed!\n")
+
+
+def test_concurrent_scanning():
+    """Test that threads sharing a detector all get complete results."""
+    print("Testing Concurrent Scanning...")
+    print("=" * 50)
+
+    from concurrent.futures import ThreadPoolExecutor
+    detector = CreditCardDetector()
+    text = "Order 4111-1111-1111-1111 paid, ref 5555555555554444.\n" * 2000
+    expected = detector.find_card_numbers(text)
+
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        results = list(pool.map(detector.find_card_numbers, [text] * 32))
+    assert all(result == expected for result in results), "Concurrent scan mismatch"
+
+    print(f"\n✓ PASS: 32 concurrent scans each found {len(expected)} cards")
+    print("\n" + "=" * 50)
+    print("✓ Concurrent scanning confirmed!\n")
+
+
+def test_directory_binary_skip():
+    """Test that scan_directory skips binary files of caller-added extensions."""
+    print("Testing Directory Binary Skip...")
+    print("=" * 50)
+
+    import os
+    import tempfile
+    detector = CreditCardDetector()
+    with tempfile.TemporaryDirectory() as tmp:
+        os.makedirs(os.path.join(tmp, "sub"))
+        with open(os.path.join(tmp, "sub", "notes.dat"), "w") as f:
+            f.write("card 4111111111111111\n")
+        with open(os.path.join(tmp, "blob.dat"), "wb") as f:
+            f.write(b"\x89PNG\0\0 4111111111111111\n")
+        with open(os.path.join(tmp, "padded.log"), "wb") as f:
+            f.write(b"\0" * 64 + b"card 5555555555554444\n")
+
+        findings = detector.scan_directory(tmp, extensions=[".dat", ".log"], jobs=1)
+        files = sorted(os.path.basename(f["file"]) for f in findings)
+        assert files == ["notes.dat", "padded.log"], f"Unexpected files: {files}"
+
+    print("\n✓ PASS: binary .dat skipped; text .dat and NUL-padded .log scanned")
+    print("\n" + "=" * 50)
+    print("✓ Binary detection confirmed!\n")
+
+
+def test_parallel_directory_scan():
+    """Test that a process-pool directory scan matches an in-process one."""
+    print("Testing Parallel Directory Scan...")
+    print("=" * 50)
+
+    import os
+    import tempfile
+    from concurrent.futures.process import BrokenProcessPool
+    import card_detector
+    detector = CreditCardDetector()
+    with tempfile.TemporaryDirectory() as tmp:
+        for i in range(6):
+            with open(os.path.join(tmp, f"notes{i}.txt"), "w") as f:
+                f.write(f"row {i}\ncard 4111 1111 1111 1111\n" * (i + 1))
+
+        serial = detector.scan_directory(tmp, jobs=1)
+        parallel = detector.scan_directory(tmp, jobs=2)
+        assert len(serial) == 21, f"Unexpected findings: {serial}"
+        assert parallel == serial, "Process pool changed the findings"
+
+        class BrokenPool:
+            def __init__(self, *args, **kwargs):
+                pass
+
+            def __enter__(self):
+                return self
+
+            def __exit__(self, *exc):
+                return False
+
+            def map(self, *args, **kwargs):
+                raise BrokenProcessPool("worker died")
+
+        original = card_detector.ProcessPoolExecutor
+        card_detector.ProcessPoolExecutor = BrokenPool
+        try:
+            fallback = detector.scan_directory(tmp, jobs=2)
+        finally:
+            card_detector.ProcessPoolExecutor = original
+        assert fallback == serial, "In-process fallback changed the findings"
+
+    print("\n✓ PASS: jobs=2 and a broken pool both match jobs=1")
+    print("\n" + "=" * 50)
+    print("✓ Parallel directory scan confirmed!\n")
+
+
+def test_sqlite_prefilter():
+    """Test that the SQLite prefilter never drops a row with a finding."""
+    print("Testing SQLite Prefilter...")
+    print("=" * 50)
+
+    import os
+    import sqlite3
+    import tempfile
+    # One tricky value per row, so no other cell lets the row through
+    rows = [
+        ("card 4111 1111 1111 1111", 1, 1.5, None),
+        ("nul \x00 then 5555555555554444", None, None, None),
+        ("４１１１１１１１１１１１１１１１", None, None, None),
+        ("4111111111111112 no card 2024-01-15", 2 ** 62, 0.25, None),
+        (None, 4111111111111111, None, None),
+        (None, -5555555555554444, None, None),
+        (None, None, 4111111111111111.0, None),
+        (None, None, 0.4111111111111111, None),
+        (None, None, 411111.1111111111, None),
+        (None, None, None, b"4111111111111111"),
+        (None, None, None, b"\x00\xff 5555-5555-5555-4444"),
+    ]
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "cards.db")
+        conn = sqlite3.connect(path)
+        conn.execute("CREATE TABLE t (a TEXT, b INTEGER, c REAL, d)")
+        conn.executemany("INSERT INTO t VALUES (?, ?, ?, ?)", rows)
+        conn.commit()
+        conn.close()
+
+        filtered = CreditCardDetector().scan_sqlite(path)
+        unfiltered = CreditCardDetector(db_prefilter=False).scan_sqlite(path)
+
+    assert filtered, "No findings in the sample table"
+    assert filtered == unfiltered, "Prefilter changed the findings"
+
+    print(f"\n✓ PASS: {len(filtered)} findings with and without the prefilter")
+    print("\n" + "=" * 50)
+    print("✓ SQLite prefilter confirmed!\n")
+
+
+def test_arrow_csv():
+    """Test that the pyarrow CSV path reports exactly what csv.reader does."""
+    print("Testing Arrow CSV Scanning...")
+    print("=" * 50)
+
+    import card_detector
+    if not card_detector.HAS_ARROW:
+        print("\n- SKIP: pyarrow not installed")
+        print("\n" + "=" * 50 + "\n")
+        return
+
+    import csv
+    import os
+    import tempfile
+    rows = [
+        ["id", "note", "card"],
+        ["1", "Card 4111 1111 1111 1111 on file", "5555555555554444"],
+        ["2", "multi\r\nline 4111\r\n1111-1111-1111", ""],
+        ["3", "no card here, just 2024-01-15", "1234"],
+        ["4", "\"quoted\" 378282246310005", "6011111111111117"],
+    ]
+    detector = CreditCardDetector()
+    with tempfile.TemporaryDirectory() as tmp:
+        for name, line_end, extra in (("lf.csv", "\n", ""), ("crlf.csv", "\r\n", ""),
+                                      ("ragged.csv", "\n", "4111111111111111\n")):
+            path = os.path.join(tmp, name)
+            with open(path, "w", encoding="utf-8", newline="") as f:
+                csv.writer(f, lineterminator=line_end).writerows(rows)
+                f.write(extra)
+            arrow_findings = detector.scan_csv(path)
+            card_detector.HAS_ARROW = False
+            try:
+                reader_findings = detector.scan_csv(path)
+            finally:
+                card_detector.HAS_ARROW = True
+            assert arrow_findings == reader_findings, f"Findings differ for {name}"
+            assert len(arrow_findings) >= 4, f"Missing findings for {name}"
+
+    print("\n✓ PASS: Arrow and csv.reader findings match")
+    print("\n" + "=" * 50)
+    print("✓ Arrow CSV scanning confirmed!\n")
+
+
 def demo_basic_usage():
     """Demonstrate basic usage of the detector."""
     print("DEMONSTRATION: Basic Usage")
@@ -255,6 +665,19 @@ if __name__ == "__main__":
     test_card_brand_detection()
     test_text_search()
     test_modern_bin_lengths()
+    test_luhn_table_sum()
+    test_native_luhn()
+    test_luhn_batch()
+    test_bin_prefix_brands()
+    test_candidate_scanner_engines()
+    test_unicode_digits()
+    test_bytes_input()
+    test_chunked_text_file()
+    test_concurrent_scanning()
+    test_directory_binary_skip()
+    test_parallel_directory_scan()
+    test_sqlite_prefilter()
+    test_arrow_csv()
     
     # Show demo
     demo_basic_usage()